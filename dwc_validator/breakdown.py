@@ -2,6 +2,7 @@
 Breakdowns are used to generate the breakdowns section of the validation
 """
 from typing import Dict
+import numpy
 import pandas as pd
 from pandas import DataFrame
 
@@ -13,24 +14,27 @@ def generate_breakdowns(dataframe: DataFrame) -> Dict[str, Dict[str, int]]:
     :return:
     """
     breakdowns = {}
+    columns = set(dataframe.columns)
 
-    if 'year' in dataframe.columns:
-        breakdowns['year'] = simple_breakdown(dataframe, 'year')
-    if 'month' in dataframe.columns:
-        breakdowns['month'] = simple_breakdown(dataframe, 'month')
-    if 'day' in dataframe.columns:
-        breakdowns['day'] = simple_breakdown(dataframe, 'day')
-    if 'scientificName' in dataframe.columns:
-        breakdowns['scientificName'] = top_values_breakdown(
-            dataframe, 'scientificName', 20)
-    if 'family' in dataframe.columns:
-        breakdowns['family'] = top_values_breakdown(dataframe, 'family', 20)
-    if 'eventDate' in dataframe.columns:
+    # eventDate takes precedence over the year, month and day fields
+    if 'eventDate' in columns:
         year_group_by, month_group_by, day_group_by = generate_event_date_breakdown(
             dataframe)
         breakdowns['year'] = year_group_by
         breakdowns['month'] = month_group_by
         breakdowns['day'] = day_group_by
+    else:
+        if 'year' in columns:
+            breakdowns['year'] = simple_breakdown(dataframe, 'year')
+        if 'month' in columns:
+            breakdowns['month'] = simple_breakdown(dataframe, 'month')
+        if 'day' in columns:
+            breakdowns['day'] = simple_breakdown(dataframe, 'day')
+    if 'scientificName' in columns:
+        breakdowns['scientificName'] = top_values_breakdown(
+            dataframe, 'scientificName', 20)
+    if 'family' in columns:
+        breakdowns['family'] = top_values_breakdown(dataframe, 'family', 20)
     return breakdowns
 
 
@@ -40,15 +44,8 @@ def field_populated_counts(dataframe: DataFrame) -> Dict[str, int]:
     :param dataframe:
     :return:
     """
-    # Get list of columns
-    columns_list = dataframe.columns.tolist()
-
-    # Get count of non-empty values for each column
-    non_empty_counts = dataframe.notna().sum()
-
-    # Create a dictionary with column names as keys and non-empty counts as
-    # values
-    return {column: int(non_empty_counts[column]) for column in columns_list}
+    # Get count of non-empty values for each column, keyed by column name
+    return dataframe.notna().sum().astype(int).to_dict()
 
 
 def top_values_breakdown(dataframe: DataFrame, field, limit) -> Dict[str, int]:
@@ -59,7 +56,8 @@ def top_values_breakdown(dataframe: DataFrame, field, limit) -> Dict[str, int]:
     :param limit:
     :return:
     """
-    return dataframe[field].value_counts().head(limit).to_dict()
+    # only the top values are needed, so avoid sorting the whole distribution
+    return dataframe[field].value_counts(sort=False).nlargest(limit).to_dict()
 
 
 def simple_breakdown(dataframe: DataFrame, field) -> Dict[str, int]:
@@ -69,9 +67,9 @@ def simple_breakdown(dataframe: DataFrame, field) -> Dict[str, int]:
     :param field:
     :return:
     """
-    return {
-        str(key): value for key,
-        value in dataframe[field].value_counts().to_dict().items()}
+    value_counts = dataframe[field].value_counts()
+    value_counts.index = value_counts.index.astype(str)
+    return value_counts.to_dict()
 
 
 def generate_event_date_breakdown(
@@ -82,21 +80,41 @@ def generate_event_date_breakdown(
     :return:
     """
 
-    # Parse 'eventDate' field, coerce errors
-    dataframe['eventDate'] = pd.to_datetime(dataframe['eventDate'], errors='coerce')
-
-    # Filter out records with valid dates
-    valid_records = dataframe.dropna(subset=['eventDate'])
+    # Parse 'eventDate' field, coerce errors and keep only the valid dates.
+    # The input dataframe is left untouched.
+    event_dates = pd.to_datetime(
+        dataframe['eventDate'], errors='coerce', format='ISO8601', cache=True).dropna()
+
+    if pd.api.types.is_datetime64_any_dtype(event_dates):
+        years = event_dates.dt.year.to_numpy()
+        months = event_dates.dt.month.to_numpy()
+        days = event_dates.dt.day.to_numpy()
+    else:
+        # Values with different UTC offsets, or zoned datetimes mixed with
+        # plain dates, parse to an object Series of Timestamps that has no
+        # .dt accessor, so take the local date parts from each value
+        years = numpy.fromiter((value.year for value in event_dates), dtype=int, count=len(event_dates))
+        months = numpy.fromiter((value.month for value in event_dates), dtype=int, count=len(event_dates))
+        days = numpy.fromiter((value.day for value in event_dates), dtype=int, count=len(event_dates))
+
+    year_group_by = integer_counts(years)
+    month_group_by = integer_counts(months)
+    day_group_by = integer_counts(days)
 
-    valid_records['year'] = valid_records['eventDate'].map(lambda x: x.year)
-    valid_records['month'] = valid_records['eventDate'].map(lambda x: x.month)
-    valid_records['day'] = valid_records['eventDate'].map(lambda x: x.day)
+    return year_group_by, month_group_by, day_group_by
 
-    year_group_by = valid_records['year'].to_frame().groupby(
-        by="year").size().to_dict()
-    month_group_by = valid_records['month'].to_frame().groupby(
-        by="month").size().to_dict()
-    day_group_by = valid_records['day'].to_frame().groupby(
-        by="day").size().to_dict()
 
-    return year_group_by, month_group_by, day_group_by
+def integer_counts(values: numpy.ndarray) -> Dict[int, int]:
+    """
+    Count the occurrences of each value in an array of integers, ordered by value
+    :param values:
+    :return:
+    """
+    if len(values) == 0:
+        return {}
+
+    # bincount over the offset values is a single pass with no hashing
+    offset = values.min()
+    counts = numpy.bincount(values - offset)
+    present = numpy.flatnonzero(counts)
+    return dict(zip((present + offset).tolist(), counts[present].tolist()))
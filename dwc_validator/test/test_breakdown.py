@@ -0,0 +1,59 @@
+"""
+Module: test_breakdown
+Description: This module contains test cases for the breakdown functionality.
+"""
+
+import unittest
+import pandas as pd
+from dwc_validator.breakdown import generate_event_date_breakdown
+
+
+class EventDateBreakdownTest(unittest.TestCase):
+    """Tests the eventDate breakdowns."""
+
+    def test_mixed_utc_offsets(self):
+        """Tests eventDate values carrying different UTC offsets."""
+        dataframe = pd.DataFrame({'eventDate': [
+            '2020-01-01T10:00:00+10:00',
+            '2020-02-01T10:00:00+09:30']})
+
+        year, month, day = generate_event_date_breakdown(dataframe)
+        self.assertEqual({2020: 2}, year)
+        self.assertEqual({1: 1, 2: 1}, month)
+        self.assertEqual({1: 2}, day)
+
+    def test_reduced_precision_dates(self):
+        """Tests eventDate values given to year, month or day precision."""
+        dataframe = pd.DataFrame({'eventDate': ['2020', '2020-03', '2020-03-15']})
+
+        year, month, day = generate_event_date_breakdown(dataframe)
+        self.assertEqual({2020: 3}, year)
+        self.assertEqual({1: 1, 3: 2}, month)
+        self.assertEqual({1: 2, 15: 1}, day)
+
+    def test_year_only_first_row(self):
+        """Tests a year-only first value does not fix the format for the remaining values."""
+        dataframe = pd.DataFrame({'eventDate': ['2019', '2020-05-17T08:30:00', '2021-07']})
+
+        year, month, day = generate_event_date_breakdown(dataframe)
+        self.assertEqual({2019: 1, 2020: 1, 2021: 1}, year)
+        self.assertEqual({1: 1, 5: 1, 7: 1}, month)
+        self.assertEqual({1: 2, 17: 1}, day)
+
+    def test_mixed_dates_and_datetimes(self):
+        """Tests plain dates mixed with zoned datetimes."""
+        dataframe = pd.DataFrame({'eventDate': ['2020-01-01', '2020-02-01T10:00:00Z']})
+
+        year, month, day = generate_event_date_breakdown(dataframe)
+        self.assertEqual({2020: 2}, year)
+        self.assertEqual({1: 1, 2: 1}, month)
+        self.assertEqual({1: 2}, day)
+
+    def test_non_iso_dates_excluded(self):
+        """Tests non ISO 8601 values and date intervals are left out of the breakdowns."""
+        dataframe = pd.DataFrame({'eventDate': ['15/03/2020', '2020-01-01/2020-01-05', '2020-04-02', None]})
+
+        year, month, day = generate_event_date_breakdown(dataframe)
+        self.assertEqual({2020: 1}, year)
+        self.assertEqual({4: 1}, month)
+        self.assertEqual({2: 1}, day)
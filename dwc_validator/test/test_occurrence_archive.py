@@ -51,6 +51,12 @@ class OccurrenceTestValidator(unittest.TestCase):
             self.assertEqual(
                 1, df_validation_report.core.coordinates_report.invalid_decimal_longitude_count)
 
+            # assert non-numeric coordinates are flagged
+            self.assertIn(
+                "NON_NUMERIC_VALUES_IN_DECIMALLATITUDE", df_validation_report.core.warnings)
+            self.assertIn(
+                "NON_NUMERIC_VALUES_IN_DECIMALLONGITUDE", df_validation_report.core.warnings)
+
     def test_validate_out_of_range_coordinates(self):
         """Tests the DwCA validator with with out of range coordinates."""
         with DwCAReader(occurrence_data_path("dwca-out-of-range-coordinates")) as dwca:
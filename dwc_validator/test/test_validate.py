@@ -0,0 +1,46 @@
+"""
+Module: test_validate
+Description: This module contains test cases for the dataframe validation functions.
+"""
+
+import unittest
+import pandas as pd
+from dwc_validator import validate
+
+
+class ValidateDataFrameTest(unittest.TestCase):
+    """Tests the dataframe validation functions."""
+
+    def test_required_fields_duplicated_column(self):
+        """Tests required fields are counted when a column label is duplicated."""
+        dataframe = pd.DataFrame(
+            [['e1', '2020-01-01', None],
+             ['e2', None, None],
+             ['e3', None, '2021-03-04']],
+            columns=['eventID', 'eventDate', 'eventDate'])
+
+        self.assertEqual(2, validate.validate_required_fields(dataframe, validate.temporal_fields))
+
+        df_validation_report = validate.validate_event_dataframe(dataframe)
+        self.assertEqual(2, df_validation_report.records_with_temporal_count)
+
+    def test_vocabulary_report_numeric_column(self):
+        """Tests a vocabulary column read with a numeric dtype is reported as unrecognised."""
+        dataframe = pd.DataFrame({'geodeticDatum': [4326.0, None, 4326.0]})
+
+        vocabulary_report = validate.create_vocabulary_report(
+            dataframe, 'geodeticDatum', validate.geodetic_datum_vocabulary_lower)
+        self.assertEqual(0, vocabulary_report.recognised_count)
+        self.assertEqual(2, vocabulary_report.unrecognised_count)
+        self.assertEqual(['4326.0'], vocabulary_report.non_matching_values)
+
+    def test_vocabulary_report_non_matching_order(self):
+        """Tests non-matching values are listed once each, in order of appearance, without empty values."""
+        dataframe = pd.DataFrame({'basisOfRecord': [
+            'Zeta', 'HumanObservation', None, 'alpha', 'Zeta', 'Mid']})
+
+        vocabulary_report = validate.create_vocabulary_report(
+            dataframe, 'basisOfRecord', validate.basis_of_record_vocabulary_lower)
+        self.assertEqual(1, vocabulary_report.recognised_count)
+        self.assertEqual(4, vocabulary_report.unrecognised_count)
+        self.assertEqual(['Zeta', 'alpha', 'Mid'], vocabulary_report.non_matching_values)
@@ -3,13 +3,55 @@ This module contains functions for validating a pandas DataFrame containing Darw
 """
 
 import logging
-from typing import List
+from typing import List, Set
 import numpy
 import pandas as pd
 from pandas import DataFrame
 from dwc_validator.breakdown import field_populated_counts
 from dwc_validator.model import DFValidationReport, CoordinatesReport, VocabularyReport
-from dwc_validator.vocab import basis_of_record_vocabulary, geodetic_datum_vocabulary
+from dwc_validator.vocab import basis_of_record_vocabulary_lower, geodetic_datum_vocabulary_lower
+
+# Fields that should only hold numeric values
+numeric_fields = (
+    'decimalLatitude',
+    'decimalLongitude',
+    'coordinateUncertaintyInMeters',
+    'coordinatePrecision',
+    'elevation',
+    'depth',
+    'minimumDepthInMeters',
+    'maximumDepthInMeters',
+    'minimumDistanceAboveSurfaceInMeters',
+    'maximumDistanceAboveSurfaceInMeters',
+    'individualCount',
+    'organismQuantity',
+    'organismSize',
+    'sampleSizeValue',
+    'temperatureInCelsius',
+    'organismAge',
+    'year',
+    'month',
+    'day',
+    'startDayOfYear',
+    'endDayOfYear')
+
+# Fields that supply taxonomic information
+taxonomy_fields = (
+    'scientificName',
+    'scientificNameID',
+    'taxonID',
+    'genus',
+    'family',
+    'order',
+    'class',
+    'phylum',
+    'kingdom')
+
+# Fields that supply date information
+temporal_fields = ('eventDate', 'year', 'month', 'day')
+
+# Fields that supply the recorder
+recorded_by_fields = ('recordedBy', 'recordedByID')
 
 
 def validate_occurrence_dataframe(
@@ -34,51 +76,38 @@ def validate_occurrence_dataframe(
     validate_numeric_fields(dataframe, warnings)
 
     # check taxonomic information supplied - create warning if missing
-    valid_taxon_count = validate_required_fields(
-        dataframe,
-        [
-            'scientificName',
-            'scientificNameID',
-            'taxonID',
-            'genus',
-            'family',
-            'order',
-            'class',
-            'phylum',
-            'kingdom'])
+    valid_taxon_count = validate_required_fields(dataframe, taxonomy_fields)
 
     # check date information supplied - create warning if missing
-    valid_temporal_count = validate_required_fields(
-        dataframe, ['eventDate', 'year', 'month', 'day'])
+    valid_temporal_count = validate_required_fields(dataframe, temporal_fields)
 
     # validate coordinates - create warning if out of range
     coordinates_report = generate_coordinates_report(dataframe, warnings)
 
     # check recordedBy, recordedByID - create warning if missing
-    valid_recorded_by_count = validate_required_fields(
-        dataframe, ['recordedBy', 'recordedByID'])
+    valid_recorded_by_count = validate_required_fields(dataframe, recorded_by_fields)
 
     # check basic compliance with vocabs - basisOfRecord, geodeticDatum, etc.
     vocabs_reports = [
         create_vocabulary_report(
             dataframe,
             "basisOfRecord",
-            basis_of_record_vocabulary),
+            basis_of_record_vocabulary_lower),
         create_vocabulary_report(
             dataframe,
             "geodeticDatum",
-            geodetic_datum_vocabulary)]
+            geodetic_datum_vocabulary_lower)]
 
     return DFValidationReport(
         record_type="Occurrence",
         record_count=len(dataframe),
-        record_error_count=int(record_error_count),
+        record_error_count=record_error_count,
         errors=errors,
         warnings=warnings,
         coordinates_report=coordinates_report,
-        records_with_taxonomy_count=int(valid_taxon_count),
-        records_with_temporal_count=int(valid_temporal_count),
-        records_with_recorded_by_count=int(valid_recorded_by_count),
+        records_with_taxonomy_count=valid_taxon_count,
+        records_with_temporal_count=valid_temporal_count,
+        records_with_recorded_by_count=valid_recorded_by_count,
         column_counts=field_populated_counts(dataframe),
         vocab_reports=vocabs_reports
     )
@@ -101,31 +130,29 @@ def validate_event_dataframe(dataframe: DataFrame) -> DFValidationReport:
     validate_numeric_fields(dataframe, warnings)
 
     # check date information supplied - create warning if missing
-    valid_temporal_count = validate_required_fields(
-        dataframe, ['eventDate', 'year', 'month', 'day'])
+    valid_temporal_count = validate_required_fields(dataframe, temporal_fields)
 
     # validate coordinates - create warning if out of range
     coordinates_report = generate_coordinates_report(dataframe, warnings)
 
     # check recordedBy, recordedByID - create warning if missing
-    valid_recorded_by_count = validate_required_fields(
-        dataframe, ['recordedBy', 'recordedByID'])
+    valid_recorded_by_count = validate_required_fields(dataframe, recorded_by_fields)
 
     vocabs_reports = [
         create_vocabulary_report(
-            dataframe, "geodeticDatum", geodetic_datum_vocabulary)
+            dataframe, "geodeticDatum", geodetic_datum_vocabulary_lower)
     ]
 
     return DFValidationReport(
         record_type="Event",
         record_count=len(dataframe),
-        record_error_count=int(record_error_count),
+        record_error_count=record_error_count,
         errors=errors,
         warnings=warnings,
         coordinates_report=coordinates_report,
         records_with_taxonomy_count=0,
-        records_with_temporal_count=int(valid_temporal_count),
-        records_with_recorded_by_count=int(valid_recorded_by_count),
+        records_with_temporal_count=valid_temporal_count,
+        records_with_recorded_by_count=valid_recorded_by_count,
         column_counts=field_populated_counts(dataframe),
         vocab_reports=vocabs_reports
     )
@@ -141,17 +168,28 @@ def validate_required_fields(dataframe: DataFrame, required_fields) -> int:
     Returns:
     - Count of records with at least one of the required fields populated.
     """
-    # Check if all required fields are present in the DataFrame
-    if not any(field in dataframe.columns for field in required_fields):
+    # Check if any of the required fields are present in the DataFrame
+    columns = set(dataframe.columns)
+    present_fields = [field for field in required_fields if field in columns]
+    if not present_fields:
         logging.error("Error: One or more required fields are missing.")
         return 0
 
-    present_fields = filter(lambda x: x in dataframe.columns, required_fields)
+    # Nothing to count in an empty data frame
+    if len(dataframe) == 0:
+        return 0
 
     # Count the number of records with at least one of the required fields
-    # populated
-    at_least_one_populated_count = dataframe[present_fields].notnull().any(
-        axis=1).sum()
+    # populated, OR-ing one column at a time rather than building a
+    # records x fields boolean frame
+    populated = numpy.zeros(len(dataframe), dtype=bool)
+    for field in present_fields:
+        field_populated = dataframe[field].notna().to_numpy()
+        # a duplicated column label selects a frame, so reduce it to one mask
+        if field_populated.ndim > 1:
+            field_populated = field_populated.any(axis=1)
+        populated |= field_populated
+    at_least_one_populated_count = int(numpy.count_nonzero(populated))
 
     # Print the count and return it
     logging.info(
@@ -181,15 +219,15 @@ def generate_coordinates_report(
     lat_column_non_empty_count = dataframe['decimalLatitude'].count()
     lon_column_non_empty_count = dataframe['decimalLongitude'].count()
 
-    # get a count of fields populated with valid numeric values
-    lat_column = pd.to_numeric(dataframe['decimalLatitude'], errors='coerce')
-    lon_column = pd.to_numeric(dataframe['decimalLongitude'], errors='coerce')
+    # get the numeric values, non-numeric values are coerced to NaN
+    lat_values = pd.to_numeric(dataframe['decimalLatitude'], errors='coerce').to_numpy(
+        dtype=float, na_value=numpy.nan)
+    lon_values = pd.to_numeric(dataframe['decimalLongitude'], errors='coerce').to_numpy(
+        dtype=float, na_value=numpy.nan)
 
-    # check if all values are valid
-    lat_valid_count = lat_column.astype(
-        float).between(-90, 90, inclusive='both').sum()
-    lon_valid_count = lon_column.astype(
-        float).between(-180, 180, inclusive='both').sum()
+    # count the values within range - NaN fails both comparisons
+    lat_valid_count = numpy.count_nonzero((lat_values >= -90) & (lat_values <= 90))
+    lon_valid_count = numpy.count_nonzero((lon_values >= -180) & (lon_values <= 180))
 
     if lat_valid_count == lat_column_non_empty_count and lon_valid_count == lon_column_non_empty_count:
         logging.info("All supplied coordinate values are valid.")
@@ -235,22 +273,24 @@ def check_id_fields(
                 "The %s field is not present in the core file.", field)
             return len(dataframe)
 
-        if id_field_series.notnull().all():
+        missing_count = int(id_field_series.isna().sum())
+        if missing_count == 0:
             logging.info("The %s field is populated for all rows.", field)
 
             if len(id_fields) == 1:
-                if id_field_series.nunique() == dataframe.shape[0]:
+                duplicate_count = int(id_field_series.duplicated().sum())
+                if duplicate_count == 0:
                     logging.info(
                         "The %s has unique values for all rows.", field)
                 else:
                     errors.append(f"DUPLICATE_{field.upper()}_VALUES")
                     logging.error(
                         "The %s field does not have unique values for all rows.", field)
-                    return id_field_series.duplicated().sum()
+                    return duplicate_count
         else:
             errors.append(f"MISSING_{field.upper()}_FIELD_VALUES")
             logging.error("The %s field is not populated for all rows.", field)
-            return id_field_series.isna().sum()
+            return missing_count
 
     return 0
 
@@ -258,14 +298,15 @@ def check_id_fields(
 def create_vocabulary_report(
         dataframe: DataFrame,
         field: str,
-        controlled_vocabulary: List[str]) -> VocabularyReport:
+        controlled_vocabulary_lower: Set[str]) -> VocabularyReport:
     """
     Count the number of records with a case-insensitive value in the specified field matching a controlled vocabulary.
 
     Parameters:
     - dataframe: pandas DataFrame
     - field: str, the field/column in the DataFrame to check
-    - controlled_vocabulary: list or set, the controlled vocabulary to compare against
+    - controlled_vocabulary_lower: set, the lowercase controlled vocabulary to compare against
+      e.g. basis_of_record_vocabulary_lower
 
     Returns:
     - Count of records with a case-insensitive value in the specified field matching the controlled vocabulary.
@@ -275,32 +316,21 @@ def create_vocabulary_report(
         logging.error("Error: Field '%s' not found in the DataFrame.", field)
         return VocabularyReport(field, False, 0, 0, [])
 
-    # Convert both field values and controlled vocabulary to lowercase (or
-    # uppercase)
-    not_populated_count = dataframe[field].isna().sum()
-    populated_values = dataframe[field].dropna()
+    # Encode the values so that only the distinct values are lowercased and
+    # matched against the controlled vocabulary. Empty values are encoded as -1.
+    codes, uniques = pd.factorize(dataframe[field])
+    populated_codes = codes[codes != -1]
+    not_populated_count = len(codes) - len(populated_codes)
     non_matching = []
     matching_records_count = 0
 
-    if len(populated_values) > 0:
-        field_values_lower = populated_values.str.lower()
-        controlled_vocabulary_lower = set(
-            value.lower() for value in controlled_vocabulary)
-
-        # Count the number of records with a case-insensitive value in the
-        # specified field matching the controlled vocabulary
-        matching_records_count = field_values_lower.isin(
-            controlled_vocabulary_lower).sum()
-
-        # pylint: disable=broad-exception-caught
-        try:
-            x = dataframe.loc[~dataframe[field].str.lower().isin(controlled_vocabulary_lower)][field].to_numpy()
-            non_matching = numpy.unique(x.astype(numpy.str_))[:10].tolist()
-            if 'nan' in non_matching:
-                non_matching.remove('nan')
-        except Exception as e:
-            logging.error("Error with getting non matching values %s", e, exc_info=True)
-            non_matching = []
+    if len(populated_codes) > 0:
+        # count the records whose value matched
+        unique_matches = pd.Index(uniques).astype(str).str.lower().isin(controlled_vocabulary_lower)
+        matching_records_count = numpy.count_nonzero(unique_matches[populated_codes])
+
+        # first 10 distinct non-matching values, in order of appearance
+        non_matching = [str(value) for value in uniques[~unique_matches][:10]]
 
     # Print the count and return it
     logging.info(
@@ -322,44 +352,25 @@ def validate_numeric_fields(dataframe: DataFrame, warnings: List[str]):
     :param warnings: the list of warnings to append to
     :return: the list of warnings
     """
-    numeric_fields = [
-        'decimalLatitude',
-        'decimalLongitude',
-        'coordinateUncertaintyInMeters',
-        'coordinatePrecision',
-        'elevation',
-        'depth',
-        'minimumDepthInMeters',
-        'maximumDepthInMeters',
-        'minimumDistanceAboveSurfaceInMeters',
-        'maximumDistanceAboveSurfaceInMeters',
-        'individualCount',
-        'organismQuantity',
-        'organismSize',
-        'sampleSizeValue',
-        'temperatureInCelsius',
-        'organismAge',
-        'year',
-        'month',
-        'day',
-        'startDayOfYear',
-        'endDayOfYear']
-
-    for field in numeric_fields:
-        if field in dataframe.columns:
-
-            numeric_test = pd.to_numeric(dataframe[field], errors='coerce')
-
-            # Check if the values are either numeric or NaN (for empty strings)
-            is_numeric_or_empty = numeric_test.apply(lambda x: pd.isna(x) or pd.api.types.is_numeric_dtype(
-                x) or pd.api.types.is_float(x) or pd.api.types.is_integer(x))
-
-            # Return True if all values are numeric or empty, False otherwise
-            is_valid = is_numeric_or_empty.all()
-
-            if not is_valid:
-                logging.error(
-                    "Non-numeric values found in field: %s", field)
-                warnings.append(f"NON_NUMERIC_VALUES_IN_{field.upper()}")
+    # Columns already read with a numeric dtype can only hold numbers or NaN,
+    # so only the remaining fields present need converting
+    fields_to_check = [
+        field for field in numeric_fields
+        if field in dataframe.columns and not pd.api.types.is_numeric_dtype(dataframe[field])]
+    if not fields_to_check:
+        return warnings
+
+    values = dataframe[fields_to_check]
+    numeric_test = values.apply(pd.to_numeric, errors='coerce')
+
+    # Values that could not be converted are coerced to NaN, so a field is
+    # valid if every value is either numeric or was empty
+    is_valid = (numeric_test.notna() | values.isna()).all()
+
+    for field in fields_to_check:
+        if not is_valid[field]:
+            logging.error(
+                "Non-numeric values found in field: %s", field)
+            warnings.append(f"NON_NUMERIC_VALUES_IN_{field.upper()}")
 
     return warnings
@@ -11,6 +11,10 @@ from dwc_validator import validate
 from dwc_validator.breakdown import generate_breakdowns
 from dwc_validator.model import DwCAValidationReport, DFValidationReport
 
+# Qualified row types of the supported core and extension files
+occurrence_type = qn('Occurrence')
+event_type = qn('Event')
+
 
 def validate_archive(
         dwca: DwCAReader,
@@ -35,7 +39,7 @@ def validate_archive(
     if core_type:
         dataset_type = core_type[core_type.rfind("/") + 1:]
 
-    if dwca.descriptor.core.type == qn('Occurrence'):
+    if core_type == occurrence_type:
 
         logging.info("Occurrence core type")
         fields = dwca.descriptor.core.fields
@@ -51,13 +55,13 @@ def validate_archive(
         df_validation_report = validate.validate_occurrence_dataframe(
             core_df, id_fields, id_term)
 
-    elif dwca.descriptor.core.type == qn('Event'):
+    elif core_type == event_type:
         logging.info("Event core type")
         df_validation_report = validate.validate_event_dataframe(core_df)
 
     else:
-        logging.info("Invalid core type: %s", dwca.descriptor.core.type)
-        df_validation_report = DFValidationReport(record_type=dwca.descriptor.core.type,
+        logging.info("Invalid core type: %s", core_type)
+        df_validation_report = DFValidationReport(record_type=core_type,
                                                   errors=["UNSUPPORTED_CORE_TYPE"],
                                                   warnings=[],
                                                   column_counts={},
@@ -73,10 +77,10 @@ def validate_archive(
     breakdowns.update(generate_breakdowns(core_df))
 
     # occ_df = None
-    if dwca.descriptor.core.type == qn('Event') and dwca.descriptor.extensions:
+    if core_type == event_type and dwca.descriptor.extensions:
 
         for extension in dwca.descriptor.extensions:
-            if extension.type == qn('Occurrence'):
+            if extension.type == occurrence_type:
 
                 occ_df = dwca.pd_read(
                     extension.file_location, parse_dates=False)
@@ -108,11 +112,11 @@ def get_id_dwc_term(dataframe: DataFrame, fields):
     id_term = None
     if "id" in dataframe.columns:
         col_idx = dataframe.columns.get_loc("id")
-        matching_fields = [field["term"] for field in fields if field.get("index") == col_idx]
 
-        if matching_fields:
-            qualified_term = next(filter(None, matching_fields), None)
+        # stop at the first field mapped to the id column with a term
+        qualified_term = next(
+            (field["term"] for field in fields if field.get("index") == col_idx and field["term"]), None)
 
-            if qualified_term:
-                id_term = qualified_term.rsplit("/", 1)[-1]
+        if qualified_term:
+            id_term = qualified_term.rsplit("/", 1)[-1]
     return id_term